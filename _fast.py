@@ -0,0 +1,78 @@
+"""
+Float kernels for the symmetry fast path.
+
+This lives in its own module so that importing `symmetry` stays cheap: if numba
+is installed, the kernel below is JIT-compiled on first use, and that compile
+cost is only paid by callers that actually run the symmetry search. numba is
+entirely optional — without it the same function runs as a tight pure-Python
+float loop.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    np = None
+    njit = None
+    HAVE_NUMBA = False
+
+
+def prepare(values):
+    """
+    Convert a coordinate list into the container the kernel expects.
+
+    Under numba the kernel must be fed contiguous float64 arrays: plain Python
+    lists are treated as reflected lists, which are deprecated, defeat
+    cache=True, and pay an O(N) conversion on every call. Without numba the
+    list is returned unchanged.
+
+    :param values: List of floats
+    :return: np.float64 array when the JIT kernel is active, else the list
+    """
+    if HAVE_NUMBA:
+        return np.asarray(values, dtype=np.float64)
+    return values
+
+
+def is_symmetry(xs, ys, m, b, x_vert, vertical, tol):
+    """
+    Decide whether the line described by the scalar parameters is a symmetry
+    line for the points (xs[i], ys[i]).
+
+    Written as nested scalar loops with no object allocation so numba can
+    compile it to a SIMD-friendly machine loop.
+
+    :param xs: X coordinates as floats
+    :param ys: Y coordinates as floats
+    :param m: Line slope (ignored when vertical)
+    :param b: Line intercept (ignored when vertical)
+    :param x_vert: X position of a vertical line (ignored otherwise)
+    :param vertical: True if the line is vertical
+    :param tol: Absolute tolerance for coordinate comparison
+    :return: True if the line is a symmetry line
+    """
+    n = len(xs)
+    m2p1 = m * m + 1.0
+    for i in range(n):
+        x = xs[i]
+        y = ys[i]
+        if vertical:
+            fx = 2.0 * x_vert - x
+            fy = y
+        else:
+            d = (x + m * (y - b)) / m2p1
+            fx = 2.0 * d - x
+            fy = 2.0 * (m * d + b) - y
+        matched = False
+        for j in range(n):
+            if abs(fx - xs[j]) < tol and abs(fy - ys[j]) < tol:
+                matched = True
+                break
+        if not matched:
+            return False
+    return True
+
+
+if HAVE_NUMBA:
+    is_symmetry = njit(cache=True, fastmath=True)(is_symmetry)
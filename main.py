@@ -1,10 +1,12 @@
 #!/bin/python
 
+import symmetry
 from symmetry import *
 import argparse
 import re
 import matplotlib.pyplot as plt
 import matplotlib.axes
+import numpy as np
 from decimal import localcontext
 import sys
 
@@ -22,9 +24,7 @@ def plot_line(subplot: matplotlib.pyplot.Axes, line: Line, x_range: tuple[float,
     if line.is_vertical():
         subplot.plot([line.x, line.x], y_range, **kwargs)
     else:
-        subplot.plot(x_range,
-                     [float(line.slope) * x + float(line.intercept) for x in x_range],
-                     **kwargs)
+        subplot.plot(x_range, line.evaluate(x_range), **kwargs)
 
 
 def plot_symmetry_lines(points: List[Point], lines: Iterator[tuple[bool, Line]], fig: matplotlib.pyplot.Figure) -> None:
@@ -36,8 +36,12 @@ def plot_symmetry_lines(points: List[Point], lines: Iterator[tuple[bool, Line]],
     :param fig: The matplotlib figure to add the plots to
     """
     subplot = fig.add_subplot()
-    x_range = x_min, x_max = min([float(p.x) for p in points]), max([float(p.x) for p in points])
-    y_range = y_min, y_max = min([float(p.y) for p in points]), max([float(p.y) for p in points])
+    # One pass over the points instead of four comprehensions; min/max run in C
+    xy = np.fromiter((float(c) for p in points for c in (p.x, p.y)),
+                     dtype=np.float64, count=2 * len(points)).reshape(-1, 2)
+    xs, ys = xy[:, 0], xy[:, 1]
+    x_range = x_min, x_max = xs.min(), xs.max()
+    y_range = y_min, y_max = ys.min(), ys.max()
     # Make the plot square
     factor = 0.05  # could make this a parameter or global
     y_factor = abs((y_min - y_max) * factor)
@@ -54,7 +58,7 @@ def plot_symmetry_lines(points: List[Point], lines: Iterator[tuple[bool, Line]],
         else:
             plot_line(subplot, line, x_range, y_range, color="0.75", linestyle="dashed", zorder=1)
 
-    subplot.scatter([float(p.x) for p in points], [float(p.y) for p in points], color="black", zorder=3)
+    subplot.scatter(xs, ys, color="black", zorder=3)
 
 
 def main():
@@ -67,8 +71,16 @@ def main():
     parser.add_argument("--precision", "-p",
                         help="Number of digits of precision to use when comparing floating point numbers", type=int,
                         default=12)
+    parser.add_argument("--fast", action="store_true",
+                        help="Compare points with float arithmetic even at high --precision. "
+                             "Much faster, but limited to float64 accuracy (~15 digits)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of worker processes for testing candidate lines; "
+                             "0 means one per CPU")
     args = parser.parse_args()
 
+    symmetry.USE_FLOAT = args.fast
+
     logger.level = getattr(logging, args.log_level)
     logger.addHandler(logging.StreamHandler(sys.stderr))
 
@@ -78,7 +90,7 @@ def main():
         ctx.prec = args.precision
         points = [Point(*[Decimal(c) for c in p.split(",")[:2]]) for p in data if p]
         fig = plt.figure()
-        lines = list(SymmetryLineFinder(points).find_all())
+        lines = list(SymmetryLineFinder(points).find_all(jobs=args.jobs))
 
         for line in [l for is_symmetry_line, l in lines if is_symmetry_line]:
             print(line)
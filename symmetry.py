@@ -1,13 +1,59 @@
 """
 main file
 """
+import bisect
+import functools
 import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Iterator, Any
 import logging
 from decimal import *
 
+import _fast
+
 logger = logging.getLogger("symmetry")
 
+# Highest decimal precision at which coordinates can safely be compared as float64
+# (float64 carries 15-17 significant digits).
+MAX_FLOAT_PRECISION = 15
+
+# Set to True (or pass --fast to the CLI) to force the float symmetry check even
+# when the configured precision exceeds MAX_FLOAT_PRECISION. Decimal
+# multiplication is ~50x slower than float multiply, so this trades the last few
+# digits of precision for a large speedup.
+USE_FLOAT = False
+
+# Shared Decimal constants. Each Decimal("...") call re-parses its string
+# argument; the hot fold loops use these millions of times.
+_D0 = Decimal(0)
+_D1 = Decimal(1)
+_D2 = Decimal(2)
+_DNAN = Decimal("nan")
+
+# Reduced-precision contexts used by normalize(), keyed by the precision they
+# were built for. Constructing a Context is much more expensive than the
+# normalize call itself, and the precision rarely changes within a run.
+_NORM_CTX_CACHE: dict = {}
+
+
+def _float_tolerance() -> float:
+    """
+    Relative tolerance for float comparisons at the current decimal precision.
+
+    Decimal precision counts *significant* digits, so float comparisons must be
+    relative to the magnitude of the values compared: callers scale this by
+    their data's magnitude to get an absolute tolerance. Two digits are given
+    up relative to the configured precision, mirroring the way `normalize()`
+    compares decimals at slightly reduced precision. The precision is capped at
+    MAX_FLOAT_PRECISION since float64 cannot resolve differences beyond that
+    anyway (relevant when USE_FLOAT forces the fast path at higher configured
+    precision).
+
+    :return: Relative tolerance as a float
+    """
+    return 10.0 ** (2 - min(getcontext().prec, MAX_FLOAT_PRECISION))
+
 
 def normalize(d:Decimal)->Decimal:
     """
@@ -40,9 +86,36 @@ def normalize(d:Decimal)->Decimal:
     :return: Normalized decimal
     """
     prec = getcontext().prec
-    with localcontext() as ctx:
-        ctx.prec=(prec - 1)
-        return d.normalize()
+    # Passing an explicit (cached) context avoids the threadlocal push/pop that
+    # `with localcontext()` performs, and re-building a Context on every call.
+    ctx = _NORM_CTX_CACHE.get(prec)
+    if ctx is None:
+        ctx = _NORM_CTX_CACHE[prec] = Context(prec=prec - 1)
+    return d.normalize(context=ctx)
+
+
+def _test_params_worker(finder: "SymmetryLineFinder", params: tuple) -> bool:
+    """
+    Process-pool worker: test one float candidate line for symmetry.
+
+    Module-level so it pickles by reference. Delegates to the finder's own
+    _is_symmetry_params so the parallel path applies exactly the same
+    predicate (prefilter, index, tolerance) as the serial one.
+    """
+    m, b, x_vert, vertical = params
+    return finder._is_symmetry_params(m, b, x_vert, vertical)
+
+
+def _test_line_worker(prec: int, points: List["Point"], payload: tuple) -> bool:
+    """
+    Process-pool worker: test one Decimal candidate line for symmetry.
+
+    The parent's precision is applied explicitly since a freshly spawned
+    worker process starts with the default decimal context.
+    """
+    getcontext().prec = prec
+    line, known_on_line = payload
+    return line.is_symmetry_line(points, known_on_line=known_on_line)
 
 
 class Point:
@@ -50,25 +123,36 @@ class Point:
     Represents a single two-dimensional point (x,y) in a plane
     """
 
+    # Many small instances are created per run; slots avoid a per-instance
+    # __dict__ and make attribute access an index instead of a dict lookup
+    __slots__ = ("x", "y", "_nx", "_ny", "_hash")
+
     def __init__(self, x:Any, y:Any):
         if isinstance(x, float) or isinstance(y, float):
             logger.warning("Point was initialized with floats. Use Decimal or string for better precision")
         self.x = Decimal(str(x)) if x is not Decimal else x
         self.y = Decimal(str(y)) if y is not Decimal else y
+        # Normalize once here; __eq__ and __hash__ are called O(N^2) times per
+        # candidate line, and each normalize() re-enters the decimal context.
+        self._nx = normalize(self.x)
+        self._ny = normalize(self.y)
+        self._hash = hash((self._nx, self._ny))
 
     def __repr__(self):
-        return f"{self.__class__.__name__}(x={normalize(self.x)},y={normalize(self.y)})"
+        return f"{self.__class__.__name__}(x={self._nx},y={self._ny})"
 
     def __eq__(self, other):
-        return normalize(self.x) == normalize(other.x) \
-            and normalize(self.y) == normalize(other.y)
+        return self._nx == other._nx and self._ny == other._ny
 
     def __hash__(self):
-        return hash((normalize(self.x), normalize(self.y)))
+        return self._hash
 
 
 class Line:
-    def __init__(self, slope: Any = Decimal("nan"), intercept: Any = Decimal("nan"), x: Any = Decimal("nan"), point0=None,
+    __slots__ = ("slope", "intercept", "x", "_ns", "_ni", "_nx", "_hash",
+                 "_m_over_m2p1", "_inv_slope", "_fold")
+
+    def __init__(self, slope: Any = _DNAN, intercept: Any = _DNAN, x: Any = _DNAN, point0=None,
                  point1=None):
         if isinstance(slope, float) or isinstance(intercept, float) or isinstance(x, float):
             logger.warning("Line was initialized with floats. Use Decimal or string for better precision")
@@ -79,24 +163,54 @@ class Line:
         # self.point0 = point0
         # self.point1 = point1
 
+        # As with Point, normalize once up front; lines are hashed and compared
+        # repeatedly during candidate deduplication.
+        self._ns = normalize(self.slope)
+        self._ni = normalize(self.intercept)
+        self._nx = normalize(self.x)
+        self._hash = hash((self._ns if not self.slope.is_nan() else "nan",
+                           self._ni if not self.intercept.is_nan() else "nan",
+                           self._nx if not self.x.is_nan() else "nan"))
+
+        # Line-invariant factors of perpendicular_intersection_point, computed
+        # once instead of on every fold over this line.
+        if not self.is_vertical() and not self.is_horizontal():
+            self._m_over_m2p1 = self.slope / (self.slope * self.slope + _D1)
+            self._inv_slope = _D1 / self.slope
+            self._fold = self._fold_oblique
+        else:
+            self._m_over_m2p1 = None
+            self._inv_slope = None
+            # Classify once so each fold skips the per-call orientation branches
+            self._fold = self._fold_vertical if self.is_vertical() else self._fold_horizontal
+
     def __eq__(self, other):
         if self.is_vertical() and other.is_vertical():
-            return not self.x.is_nan() and normalize(self.x) == normalize(other.x)
-        return normalize(self.slope) == normalize(other.slope) \
-            and normalize(self.intercept) == normalize(other.intercept)
+            return not self.x.is_nan() and self._nx == other._nx
+        return self._ns == other._ns and self._ni == other._ni
 
     def __repr__(self):
         if self.is_vertical():
-            return f"{self.__class__.__name__}(x={normalize(self.x)})"
-        return f"{self.__class__.__name__}(m={normalize(self.slope)},b={normalize(self.intercept)})"
+            return f"{self.__class__.__name__}(x={self._nx})"
+        return f"{self.__class__.__name__}(m={self._ns},b={self._ni})"
 
     def __hash__(self):
-        s = normalize(self.slope) if not self.slope.is_nan() else "nan"
-        i = normalize(self.intercept) if not self.intercept.is_nan() else "nan"
-        x = normalize(self.x) if not self.x.is_nan() else "nan"
-        h = hash((s, i, x))
+        return self._hash
+
+    @classmethod
+    def _from_params_fast(cls, m: float, b: float, x_vert: float, vertical: bool) -> "Line":
+        """
+        Build a Line from float parameters produced by the fast candidate path.
 
-        return h
+        :param m: Slope (ignored when vertical)
+        :param b: Intercept (ignored when vertical)
+        :param x_vert: X position of a vertical line (ignored otherwise)
+        :param vertical: True if the line is vertical
+        :return: The corresponding Line
+        """
+        if vertical:
+            return cls(x=str(x_vert))
+        return cls(str(m), str(b))
 
     @staticmethod
     def from_points(p0: Point, p1: Point) -> "Line":
@@ -116,7 +230,7 @@ class Line:
             # logger.debug(f"int part 2: ({p1.y} - {slope * p1.x}) = {(p1.y - slope * p1.x)}")
             return Line(slope, (p1.y - slope * p1.x))
         else:
-            return Line(Decimal("nan"), Decimal("nan"), x=p1.x)
+            return Line(_DNAN, _DNAN, x=p1.x)
 
     def is_vertical(self):
         return self.slope.is_nan() or self.intercept.is_nan()
@@ -124,15 +238,21 @@ class Line:
     def is_horizontal(self):
         return self.slope == 0
 
-    def is_symmetry_line(self, points: List[Point]):
+    def is_symmetry_line(self, points: List[Point], known_on_line: set = None):
         """
         Evaluate whether this line is a symmetry line for the collection of points by "folding"
 
         :param points: Collection of points to evaluate
+        :param known_on_line: Optional indices of points already known to lie on
+            this line (e.g. the vertex the line was constructed through); such
+            points fold onto themselves, so their check is skipped
         :return: True if this is a symmetry line
         """
         logger.debug(f"Checking symmetry of {self}")
         for i1 in range(0, len(points)):
+            if known_on_line and i1 in known_on_line:
+                logger.debug(f"- {i1}.{points[i1]} is known to lie on this line")
+                continue
             matched = False
             f1 = self.folded_point(points[i1])
             logger.debug(f"- {i1}.{points[i1]} folds to to {f1.x}, {f1.y}")
@@ -159,6 +279,19 @@ class Line:
         logger.debug(f"{self} IS a symmetry line")
         return True
 
+    def evaluate(self, xs) -> List[float]:
+        """
+        Evaluate y = slope*x + intercept at each given x, in float arithmetic.
+
+        Handy for plotting; not meaningful for vertical lines.
+
+        :param xs: Sequence of x values
+        :return: List of y values as floats
+        """
+        m = float(self.slope)
+        b = float(self.intercept)
+        return [m * x + b for x in xs]
+
     def perpendicular_intersection_point(self, p0: Point):
         #     x = (m/(m^2+1))(y0+x0/m-b)
         #     and y = mx+b
@@ -170,7 +303,7 @@ class Line:
         # logger.debug(f"{p0.x} / {self.slope} = {(p0.x / self.slope)}")
         # logger.debug(f"{p0.y} + {p0.x / self.slope} - {self.intercept} = {(p0.y + p0.x / self.slope - self.intercept)}")
         # logger.debug(f"{(self.slope / (self.slope * self.slope + Decimal(1)))} * {(p0.y + p0.x / self.slope - self.intercept)} = {(self.slope / (self.slope * self.slope + Decimal(1))) * (p0.y + p0.x / self.slope - self.intercept)}")
-        x = (self.slope / (self.slope * self.slope + Decimal("1"))) * (p0.y + p0.x / self.slope - self.intercept)
+        x = self._m_over_m2p1 * (p0.y + p0.x * self._inv_slope - self.intercept)
         # logger.debug(f"{self.slope} * {x} = {self.slope * x}")
         # logger.debug(f"{self.slope * x}  + {self.intercept} = {self.slope * x + self.intercept}")
         y = self.slope * x + self.intercept
@@ -189,23 +322,35 @@ class Line:
         :param p0:
         :return:
         """
-        if self.contains_point(p0):
-            return p0
-        p_int = self.perpendicular_intersection_point(p0)
-        # logger.debug(f"{Decimal(2)} * {p_int.x} = {Decimal(2) * p_int.x}")
-        # logger.debug(f"{Decimal(2) * p_int.x} - {p0.x} = {Decimal(2) * p_int.x - p0.x}")
+        # No special case for a point already on the line: the fold arithmetic
+        # maps such a point (near enough) to itself, and callers compare folded
+        # points at normalize()'s reduced precision anyway. Checking
+        # contains_point here would cost a multiply, add and Decimal == on
+        # every fold while almost never firing for real data.
         # "You shouldn't trust a difference between two numbers, unless it is bigger than the mantissa [Double precision floats: (a - b) / b >= ~4e-16]"
-        return Point((Decimal("2") * p_int.x -  p0.x), (Decimal("2") * p_int.y - p0.y))
-#        return Point(Decimal(2) * p_int.x - p0.x, Decimal(2) * p_int.y - p0.y)
+        return self._fold(p0)
+
+    def _fold_vertical(self, p0: Point) -> Point:
+        return Point(_D2 * self.x - p0.x, p0.y)
+
+    def _fold_horizontal(self, p0: Point) -> Point:
+        return Point(p0.x, _D2 * self.intercept - p0.y)
+
+    def _fold_oblique(self, p0: Point) -> Point:
+        x = self._m_over_m2p1 * (p0.y + p0.x * self._inv_slope - self.intercept)
+        y = self.slope * x + self.intercept
+        return Point(_D2 * x - p0.x, _D2 * y - p0.y)
 
     def contains_point(self, p0: Point) -> bool:
         return p0.y == (p0.x * self.slope) + self.intercept
 
 
 class BisectionPoint(Point):
+    __slots__ = ("p0", "p1")
+
     def __init__(self, p0: Point, p1: Point):
-        super().__init__((p1.x - p0.x) / Decimal("2.0") + p0.x,
-                         (p1.y - p0.y) / Decimal("2.0") + p0.y)
+        super().__init__((p1.x - p0.x) / _D2 + p0.x,
+                         (p1.y - p0.y) / _D2 + p0.y)
         self.p0 = p0
         self.p1 = p1
 
@@ -217,12 +362,97 @@ class SymmetryLineFinder:
     def __init__(self, points: List[Point]):
         if len(points) <= 2:
             raise ValueError("Cannot create symmetry lines for <3 points")
-        self.points = list(set(points))  # Remove duplicates
+        # The float-path tolerance must be relative to the data's magnitude,
+        # like the Decimal path's significant-digit comparisons: coordinates
+        # given to `prec` significant digits at magnitude 10^3 quantize around
+        # 1e-9, so an unscaled 10^(2-prec) would reject genuinely symmetric
+        # inputs.
+        coords = [(float(p.x), float(p.y)) for p in points]
+        scale = max(max(abs(x), abs(y)) for x, y in coords)
+        self._tol = max(scale, 1.0) * _float_tolerance()
+        # round() digit count whose step matches the absolute tolerance
+        self._tol_digits = int(math.floor(-math.log10(self._tol)))
+        # Remove duplicates. When precision fits float64, dedup on rounded
+        # float keys instead of hashing Decimal points.
+        if getcontext().prec <= MAX_FLOAT_PRECISION:
+            unique = {(round(x, self._tol_digits),
+                       round(y, self._tol_digits)): p
+                      for p, (x, y) in zip(points, coords)}
+            self.points = list(unique.values())
+        else:
+            self.points = list(set(points))
+        # Float mirror of the coordinates for the fast symmetry check.
+        self._pts = [(float(p.x), float(p.y)) for p in self.points]
+        # float64 arrays when the JIT kernel is active (see _fast.prepare)
+        self._xs = _fast.prepare([x for x, _ in self._pts])
+        self._ys = _fast.prepare([y for _, y in self._pts])
+        # Sorted squared distances from the (float) centroid. Folding across a
+        # line through the centroid preserves these distances, so a folded
+        # point whose r^2 matches no input point can be rejected before the
+        # coordinate lookup.
+        n = len(self._pts)
+        self._cx = sum(self._xs) / n
+        self._cy = sum(self._ys) / n
+        self._r2_sorted = sorted((x - self._cx) ** 2 + (y - self._cy) ** 2 for x, y in self._pts)
+        self._centroid_cached = None
+        # Index of rounded coordinates for O(1) folded-point lookups. The keys
+        # only locate nearby points; matches are confirmed against the actual
+        # coordinates so the acceptance region is exactly self._tol.
+        self._point_index = {}
+        for x, y in self._pts:
+            key = (round(x, self._tol_digits), round(y, self._tol_digits))
+            self._point_index.setdefault(key, []).append((x, y))
+
+    def _near_known_r2(self, r2: float) -> bool:
+        """
+        True if some input point lies at (squared) centroid distance r2, up to
+        tolerance. A necessary condition for a folded point to match an input
+        point — and a much cheaper one than the coordinate lookup.
+
+        :param r2: Squared distance from the centroid
+        :return: True if an input point is at a matching distance
+        """
+        # d((r+e)^2) ~ 2*r*e, so scale the coordinate tolerance accordingly
+        tol = self._tol * (2.0 * math.sqrt(r2) + 1.0)
+        i = bisect.bisect_left(self._r2_sorted, r2 - tol)
+        return i < len(self._r2_sorted) and self._r2_sorted[i] <= r2 + tol
+
+    def _matches_point(self, x: float, y: float) -> bool:
+        """
+        True if (x, y) lies within the comparison tolerance of an input point.
+
+        The rounded keys are an index, not the predicate: the key block around
+        (x, y) is probed so that values near a rounding boundary are not
+        missed, and every hit is confirmed against the actual coordinates.
+        This keeps the acceptance region identical to the scan kernel's
+        per-axis `abs(...) < tol` check.
+
+        :param x: X coordinate
+        :param y: Y coordinate
+        :return: True if an input point matches
+        """
+        nd = self._tol_digits
+        step = 10 ** -nd
+        tol = self._tol
+        rx, ry = round(x, nd), round(y, nd)
+        for dx in (0.0, step, -step):
+            for dy in (0.0, step, -step):
+                key = (round(rx + dx, nd), round(ry + dy, nd))
+                for px, py in self._point_index.get(key, ()):
+                    if abs(x - px) < tol and abs(y - py) < tol:
+                        return True
+        return False
 
     def _centroid(self) -> Point:
-        # TODO cache
-        return Point(sum([p.x for p in self.points]) / len(self.points),
-                     sum([p.y for p in self.points]) / len(self.points))
+        if self._centroid_cached is None:
+            # Single streaming pass; no intermediate coordinate lists
+            sx = sy = _D0
+            for p in self.points:
+                sx += p.x
+                sy += p.y
+            n = Decimal(len(self.points))
+            self._centroid_cached = Point(sx / n, sy / n)
+        return self._centroid_cached
 
     def _candidate_symmetry_lines(self) -> Iterator[Line]:
         """
@@ -230,39 +460,249 @@ class SymmetryLineFinder:
         :param points:
         :return:
         """
+        for line, _ in self._candidate_lines_with_sources():
+            yield line
+
+    def _candidate_lines_with_sources(self) -> Iterator[tuple]:
+        """
+        Candidate symmetry lines paired with the indices of input points known
+        to lie on each line (the vertex a centroid-to-vertex line was drawn
+        through; None for bisection lines).
+
+        :return: Generator of (Line, set of indices or None) tuples
+        """
         if len(self.points) < 3:
             return
 
         # Lines of symmetry must pass thru _centroid
         cent = self._centroid()
 
-        # don't bother re-evaluating lines we have seen before
+        # don't bother re-evaluating lines we have seen before. Keys are small
+        # tuples rather than Line objects, so probes avoid Decimal tuple
+        # hashing. Scaled-int keys only resolve what float64 can represent, so
+        # fall back to the cached normalized decimals at higher precision.
+        prec = getcontext().prec
+        use_float_keys = prec <= MAX_FLOAT_PRECISION
+        scale = 10 ** (prec - 2)
+
+        def _key(line: Line):
+            if line.is_vertical():
+                return ("x", round(float(line.x) * scale)) if use_float_keys else ("x", line._nx)
+            if use_float_keys:
+                return round(float(line.slope) * scale), round(float(line.intercept) * scale)
+            return line._ns, line._ni
+
         visited = set()
-        # visited=
         for i0 in range(0, len(self.points) - 1):
             for i1 in range(i0 + 1, len(self.points)):
                 b = BisectionPoint(self.points[i0], self.points[i1])
                 logger.debug(f"bisection point between {i0}.{self.points[i0]} and {i1}.{self.points[i1]} is {b}")
+                if b == cent:
+                    # Antipodal pair: the midpoint and the centroid coincide,
+                    # so they determine no line together (from_points would
+                    # misreport a vertical through the centroid). The candidate
+                    # this pair implies is the line through the centroid
+                    # perpendicular to the segment — exactly the fold that maps
+                    # the pair onto each other.
+                    dx = b.p1.x - b.p0.x
+                    dy = b.p1.y - b.p0.y
+                    if dy == 0:
+                        line1 = Line(x=cent.x)
+                    else:
+                        slope = -dx / dy
+                        line1 = Line(slope, cent.y - slope * cent.x)
+                    k = _key(line1)
+                    if k not in visited:
+                        logger.debug(
+                            f"Returning perpendicular through centroid {cent} for antipodal pair {line1}")
+                        visited.add(k)
+                        yield line1, None
+                    continue
                 line1 = Line.from_points(cent, b)
-                if line1 not in visited:
+                k = _key(line1)
+                if k not in visited:
                     logger.debug(
                         f"Returning line between centroid {cent} and bisection point {line1} ({hash(line1)})")
-                    visited.add(line1)
-                    yield line1
+                    visited.add(k)
+                    yield line1, None
 
         for i0 in range(0, len(self.points)):
+            if self.points[i0] == cent:
+                logger.debug(f"  - vertex {i0}.{self.points[i0]} is the centroid; skipping")
+                continue
             line1 = Line.from_points(cent, self.points[i0])
-            if line1 not in visited:
+            k = _key(line1)
+            if k not in visited:
                 logger.debug(
                     f"Returning line between centroid {cent} and vertex {i0}.{self.points[i0]} {line1} ({hash(line1)})")
-                visited.add(line1)
-                yield line1
+                visited.add(k)
+                yield line1, {i0}
+
+    def _candidate_params(self) -> Iterator[tuple]:
+        """
+        Enumerate candidate lines as plain float parameter tuples
+        (slope, intercept, x, vertical), with nan in the unused fields.
 
-    def find_all(self) -> Iterator[tuple[bool, Line]]:
-        for line in self._candidate_symmetry_lines():
-            yield line.is_symmetry_line(self.points), line
+        Midpoints, slopes and intercepts are computed with float arithmetic
+        (instead of ~8 Decimal operations per pair) and deduplicated on rounded
+        (slope, intercept) keys. No Line object is allocated here at all; the
+        caller materializes one per surviving candidate only when needed.
 
-    def find(self) -> Iterator[Line]:
-        for is_symmetry, line in self.find_all():
+        :return: Generator of (slope, intercept, x, vertical) tuples
+        """
+        if len(self.points) < 3:
+            return
+
+        cent = self._centroid()
+        cx, cy = float(cent.x), float(cent.y)
+        nd = self._tol_digits
+        nan = float("nan")
+        visited = set()
+
+        tol = self._tol
+        # Slopes are ratios of coordinate differences, so their dedup keys are
+        # rounded at unit scale rather than the data's magnitude
+        nd_slope = min(getcontext().prec, MAX_FLOAT_PRECISION) - 2
+
+        def _emit_vertical(px: float) -> tuple:
+            """Vertical line at px, or None if already seen"""
+            key = ("x", round(px, nd))
+            if key in visited:
+                return None
+            visited.add(key)
+            return nan, nan, px, True
+
+        def _emit_oblique(m: float, b: float) -> tuple:
+            """Line y = m*x + b, or None if already seen"""
+            key = (round(m, nd_slope), round(b, nd))
+            if key in visited:
+                return None
+            visited.add(key)
+            return m, b, nan, False
+
+        def _params_through(px: float, py: float) -> tuple:
+            """Line through the centroid and (px, py), or None if already seen"""
+            if px == cx:
+                return _emit_vertical(px)
+            # `+ 0.0` turns IEEE negative zero into plain 0.0 for display
+            m = (py - cy) / (px - cx) + 0.0
+            b = py - m * px + 0.0
+            return _emit_oblique(m, b)
+
+        pts = self._pts
+        for i0 in range(len(pts) - 1):
+            x0, y0 = pts[i0]
+            for i1 in range(i0 + 1, len(pts)):
+                x1, y1 = pts[i1]
+                mx, my = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+                if abs(mx - cx) < tol and abs(my - cy) < tol:
+                    # Antipodal pair bisecting at the centroid: the implied
+                    # candidate is the line through the centroid perpendicular
+                    # to the segment, the fold mapping the pair onto each other
+                    dx, dy = x1 - x0, y1 - y0
+                    if dy == 0.0:
+                        params = _emit_vertical(cx)
+                    else:
+                        m = -dx / dy + 0.0
+                        params = _emit_oblique(m, cy - m * cx + 0.0)
+                else:
+                    params = _params_through(mx, my)
+                if params is not None:
+                    yield params
+
+        for x0, y0 in pts:
+            if abs(x0 - cx) < tol and abs(y0 - cy) < tol:
+                # A vertex on the centroid determines no line
+                continue
+            params = _params_through(x0, y0)
+            if params is not None:
+                yield params
+
+    def _candidate_symmetry_lines_fast(self) -> Iterator[Line]:
+        """
+        Float equivalent of `_candidate_symmetry_lines`: the parameter tuples
+        from `_candidate_params` materialized as Line objects.
+
+        :return: Generator of candidate lines
+        """
+        for m, b, x_vert, vertical in self._candidate_params():
+            yield Line._from_params_fast(m, b, x_vert, vertical)
+
+    def _is_symmetry_params(self, m: float, b: float, x_vert: float, vertical: bool) -> bool:
+        """
+        Float equivalent of `Line.is_symmetry_line`, valid while the configured
+        decimal precision fits in float64 (see `MAX_FLOAT_PRECISION`). Operates
+        directly on line parameters so candidates need not be materialized.
+
+        :param m: Slope (ignored when vertical)
+        :param b: Intercept (ignored when vertical)
+        :param x_vert: X position of a vertical line (ignored otherwise)
+        :param vertical: True if the line is vertical
+        :return: True if this is a symmetry line
+        """
+        if _fast.HAVE_NUMBA:
+            # The jitted scan kernel beats the hash probe once compiled
+            return _fast.is_symmetry(self._xs, self._ys,
+                                     m if not vertical else 0.0,
+                                     b if not vertical else 0.0,
+                                     x_vert if vertical else 0.0,
+                                     vertical, self._tol)
+        m2p1 = m * m + 1.0
+        for x, y in self._pts:
+            if vertical:
+                fx = 2.0 * x_vert - x
+                fy = y
+            else:
+                d = (x + m * (y - b)) / m2p1
+                fx = 2.0 * d - x
+                fy = 2.0 * (m * d + b) - y
+            fr2 = (fx - self._cx) ** 2 + (fy - self._cy) ** 2
+            if not self._near_known_r2(fr2) or not self._matches_point(fx, fy):
+                return False
+        return True
+
+    def find_all(self, jobs: int = 1) -> Iterator[tuple[bool, Line]]:
+        # The Decimal path is only needed when the user asked for more precision
+        # than float64 can represent (and did not opt into --fast).
+        use_fast = USE_FLOAT or getcontext().prec <= MAX_FLOAT_PRECISION
+        if jobs != 1:
+            yield from self._find_all_parallel(jobs, use_fast)
+        elif use_fast:
+            for m, b, x_vert, vertical in self._candidate_params():
+                yield (self._is_symmetry_params(m, b, x_vert, vertical),
+                       Line._from_params_fast(m, b, x_vert, vertical))
+        else:
+            for line, known_on_line in self._candidate_lines_with_sources():
+                yield line.is_symmetry_line(self.points, known_on_line=known_on_line), line
+
+    def _find_all_parallel(self, jobs: int, use_fast: bool) -> Iterator[tuple[bool, Line]]:
+        """
+        Test candidate lines across a process pool. Each test is independent
+        and read-only on the input points, so this scales with core count;
+        candidate generation itself stays sequential (it is comparatively
+        cheap).
+
+        :param jobs: Worker process count; 0 or negative means one per CPU
+        :param use_fast: Whether the float path is active
+        :return: Generator of (is_symmetry_line, line) tuples
+        """
+        max_workers = jobs if jobs > 0 else os.cpu_count()
+        if use_fast:
+            candidates = list(self._candidate_params())
+            worker = functools.partial(_test_params_worker, self)
+        else:
+            candidates = list(self._candidate_lines_with_sources())
+            worker = functools.partial(_test_line_worker, getcontext().prec, self.points)
+        chunksize = max(1, len(candidates) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            results = ex.map(worker, candidates, chunksize=chunksize)
+            for candidate, is_symmetry in zip(candidates, results):
+                if use_fast:
+                    yield is_symmetry, Line._from_params_fast(*candidate)
+                else:
+                    yield is_symmetry, candidate[0]
+
+    def find(self, jobs: int = 1) -> Iterator[Line]:
+        for is_symmetry, line in self.find_all(jobs=jobs):
             if is_symmetry:
                 yield line
@@ -125,6 +125,12 @@ class SymmetryTests(TestCase):
         line = Line(x=4.3)
         self.assertEqual(Point(4.3, 30), line.folded_point(Point(4.3, 30)))
 
+    def test_fold_point_on_oblique_line(self):
+        # Point on a line with a repeating-decimal slope still folds to itself
+        # (up to normalize()'s reduced-precision comparison)
+        line = Line(slope=Decimal(1) / Decimal(3), intercept=0)
+        self.assertEqual(Point(3, 1), line.folded_point(Point(3, 1)))
+
     def test_fold_point(self):
         line = Line(slope=1, intercept=2)
         self.assertEqual(Point(-1, 3), line.folded_point(Point(1, 1)))
@@ -157,6 +163,41 @@ class SymmetryTests(TestCase):
         }
         self.assertEqual(expected_lines, set(candidates))
 
+    def test_candidate_symmetry_lines_antipodal_midpoint(self):
+        # The diagonals of this rectangle bisect at the centroid; each such
+        # pair implies the perpendicular through the centroid as its candidate
+        # (not a bogus vertical line)
+        points = [
+            Point(0, 20),
+            Point(60, 20),
+            Point(60, 0),
+            Point(0, 0)
+        ]
+        candidates = set(SymmetryLineFinder(points)._candidate_symmetry_lines())
+        expected_lines = {
+            Line(x=30),
+            Line(slope=0, intercept=10),
+            # perpendiculars to the two diagonals
+            Line(slope=3, intercept=-80),
+            Line(slope=-3, intercept=100),
+            # centroid-to-vertex lines
+            Line(slope=Decimal(1) / Decimal(3), intercept=0),
+            Line(slope=Decimal(-1) / Decimal(3), intercept=20),
+        }
+        self.assertEqual(expected_lines, candidates)
+
+    def test_find_collinear_points(self):
+        # The outer pair bisects at the centroid; its implied candidate is the
+        # perpendicular through the centroid, which is a real symmetry line
+        expected_lines = {Line(slope=0, intercept=0), Line(x=2)}
+        points = [Point(0, 0), Point(1, 0), Point(3, 0), Point(4, 0)]
+        self.assertEqual(expected_lines, set(SymmetryLineFinder(points).find()))
+        # Same result on the float path
+        with localcontext() as ctx:
+            ctx.prec = 12
+            points = [Point(0, 0), Point(1, 0), Point(3, 0), Point(4, 0)]
+            self.assertEqual(expected_lines, set(SymmetryLineFinder(points).find()))
+
     def test_candidate_symmetry_lines_2_points(self):
         points = [Point(1.1, 2.2), Point(3.3, 4.4)]
         with self.assertRaises(ValueError):
@@ -167,6 +208,117 @@ class SymmetryTests(TestCase):
         with self.assertRaises(ValueError):
             SymmetryLineFinder(points)._candidate_symmetry_lines()
 
+    def test_evaluate(self):
+        line = Line(slope=1.5, intercept=-5)
+        self.assertEqual([-5.0, -2.0, 1.0], line.evaluate([0, 2, 4]))
+
+    def test_matches_point(self):
+        with localcontext() as ctx:
+            ctx.prec = 12
+            finder = SymmetryLineFinder([Point(0, 0), Point(1, 0), Point(1, 1)])
+            self.assertTrue(finder._matches_point(1.0, 0.0))
+            # Tiny float error, including across a rounding boundary
+            self.assertTrue(finder._matches_point(1.00000000000004, -0.00000000000002))
+            self.assertFalse(finder._matches_point(1.0, 0.5))
+
+    def test_matches_point_within_step_beyond_tol(self):
+        # The rounding step can exceed the tolerance (here step=1e-3,
+        # tol=2e-4); a point in the same key block but farther than the
+        # tolerance must not match
+        with localcontext() as ctx:
+            ctx.prec = 6
+            finder = SymmetryLineFinder([Point(0, 0), Point(2, 0), Point("2", "2.0006")])
+            self.assertFalse(finder._matches_point(2.0, 2.0))
+            self.assertTrue(finder._matches_point(2.0, 2.00055))
+
+    def test_find_square_fast(self):
+        # At default-ish precision the fast float path is used
+        with localcontext() as ctx:
+            ctx.prec = 12
+            points = [Point(501, 501), Point(501, 1001), Point(1001, 1001), Point(1001, 501)]
+            expected_lines = {
+                Line(slope=1, intercept=0),
+                Line(slope=-1, intercept=1502),
+                Line(x=751),
+                Line(slope=0, intercept=751)
+            }
+            lines = set(SymmetryLineFinder(points).find())
+            self.assertEqual(expected_lines, lines)
+
+    def test_candidate_symmetry_lines_fast_triangle(self):
+        with localcontext() as ctx:
+            ctx.prec = 12
+            points = [
+                Point(0, 50),
+                Point(50, 50),
+                Point(50, 0),
+            ]
+            candidates = set(SymmetryLineFinder(points)._candidate_symmetry_lines_fast())
+            expected_lines = {Line(slope=1, intercept=0), Line(slope=-2, intercept=100),
+                              Line(slope=-0.5, intercept=50)}
+            self.assertEqual(expected_lines, candidates)
+
+    def test_duplicate_points_removed_fast(self):
+        with localcontext() as ctx:
+            ctx.prec = 12
+            finder = SymmetryLineFinder([Point(0, 0), Point(0, 1), Point(1, 1),
+                                         Point(0, 0), Point("0.0", "1.0")])
+            self.assertEqual(3, len(finder.points))
+
+    def test_near_known_r2(self):
+        with localcontext() as ctx:
+            ctx.prec = 12
+            # Unit square around centroid (0.5, 0.5); all corners at r^2 = 0.5
+            finder = SymmetryLineFinder([Point(0, 0), Point(0, 1), Point(1, 1), Point(1, 0)])
+            self.assertTrue(finder._near_known_r2(0.5))
+            self.assertTrue(finder._near_known_r2(0.50000000000001))
+            self.assertFalse(finder._near_known_r2(0.25))
+            self.assertFalse(finder._near_known_r2(1.0))
+
+    def test_fast_kernel_is_symmetry(self):
+        import _fast
+        # prepare() gives the kernel the container it expects (float64 arrays
+        # under numba, plain lists otherwise) — same as the production callers
+        xs = _fast.prepare([501.0, 501.0, 1001.0, 1001.0])
+        ys = _fast.prepare([501.0, 1001.0, 1001.0, 501.0])
+        self.assertTrue(_fast.is_symmetry(xs, ys, 1.0, 0.0, 0.0, False, 1e-10))
+        self.assertTrue(_fast.is_symmetry(xs, ys, 0.0, 0.0, 751.0, True, 1e-10))
+        self.assertFalse(_fast.is_symmetry(xs, ys, 2.0, 0.0, 0.0, False, 1e-10))
+
+    def test_find_rotated_offset_square_fast(self):
+        # Square rotated 30 degrees around (1000, 1000), coordinates given to
+        # 12 significant digits: their ~1e-9 quantization must be tolerated
+        # relative to the coordinate magnitude, not absolutely
+        with localcontext() as ctx:
+            ctx.prec = 12
+            points = [Point("1012.94095226", "1048.29629131"),
+                      Point("951.703708686", "1012.94095226"),
+                      Point("987.059047745", "951.703708686"),
+                      Point("1048.29629131", "987.059047745")]
+            lines = list(SymmetryLineFinder(points).find())
+            # All four symmetry axes are found (input quantization can yield
+            # near-duplicate candidate lines for the same axis, so compare
+            # coarsely-rounded slopes rather than exact line objects)
+            self.assertEqual({-1.7321, 0.5774, 3.7321, -0.2679},
+                             {round(float(line.slope), 4) for line in lines})
+
+    def test_find_square_use_float(self):
+        # USE_FLOAT forces the float path even at this class's high precision
+        import symmetry
+        symmetry.USE_FLOAT = True
+        try:
+            points = [Point(501, 501), Point(501, 1001), Point(1001, 1001), Point(1001, 501)]
+            expected_lines = {
+                Line(slope=1, intercept=0),
+                Line(slope=-1, intercept=1502),
+                Line(x=751),
+                Line(slope=0, intercept=751)
+            }
+            lines = set(SymmetryLineFinder(points).find())
+            self.assertEqual(expected_lines, lines)
+        finally:
+            symmetry.USE_FLOAT = False
+
     def test_find_square(self):
         points = [Point(501, 501), Point(501, 1001), Point(1001, 1001), Point(1001, 501)]
         expected_lines = {
@@ -192,6 +344,33 @@ class SymmetryTests(TestCase):
         lines = set(SymmetryLineFinder(points).find())
         self.assertEqual(expected_lines, lines)
 
+    def test_find_square_parallel(self):
+        expected_lines = {
+            Line(slope=1, intercept=0),
+            Line(slope=-1, intercept=1502),
+            Line(x=751),
+            Line(slope=0, intercept=751)
+        }
+        # Decimal path (class precision is high)
+        points = [Point(501, 501), Point(501, 1001), Point(1001, 1001), Point(1001, 501)]
+        self.assertEqual(expected_lines, set(SymmetryLineFinder(points).find(jobs=2)))
+        # Float path
+        with localcontext() as ctx:
+            ctx.prec = 12
+            points = [Point(501, 501), Point(501, 1001), Point(1001, 1001), Point(1001, 501)]
+            self.assertEqual(expected_lines, set(SymmetryLineFinder(points).find(jobs=2)))
+
+    def test_find_perturbed_square_serial_matches_parallel(self):
+        # One corner pushed ~2.5x past the comparison tolerance: a borderline
+        # input that must get the same verdict from jobs=1 and jobs=2
+        with localcontext() as ctx:
+            ctx.prec = 6
+            points = [Point(0, 0), Point(2, 0), Point("2", "2.0005"), Point(0, 2)]
+            serial = set(SymmetryLineFinder(points).find())
+            parallel = set(SymmetryLineFinder(points).find(jobs=2))
+            self.assertEqual(serial, parallel)
+            self.assertEqual(set(), serial)
+
     def test_find_verysmall_and_verylarge(self):
         points = [Point("1e-16", "1e-16"),
                   Point("1e-16", "1e+16"),